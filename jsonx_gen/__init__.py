@@ -5,8 +5,8 @@ A tool that generates code to extract specific fields from JSON documents based
 Supports multiple output languages and provides both CLI and REST API interfaces.
 """
 
-from .core import extract_json_path, generate_extraction_code
+from .core import extract_json_path, extract_many, generate_all, generate_extraction_code
 
-__all__ = ['extract_json_path', 'generate_extraction_code']
+__all__ = ['extract_json_path', 'extract_many', 'generate_all', 'generate_extraction_code']
 
 __version__ = "0.1.0" 
\ No newline at end of file
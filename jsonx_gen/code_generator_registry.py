@@ -1,26 +1,310 @@
-from typing import Dict, List, Union, Callable
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, Callable
+from functools import lru_cache
+from types import MappingProxyType
 import json
 
 class CodeGeneratorRegistry:
-    _generators = {}
+    _registered: Dict[str, Callable[[Dict[str, List[List[Union[str, int]]]]], str]] = {}
+    # Read-only live view of the registered generators: callers can bind it once
+    # and look languages up directly, and still see generators registered later
+    _generators = MappingProxyType(_registered)
 
     @classmethod
     def register(cls, language: str):
         def decorator(func):
-            cls._generators[language] = func
+            cls._registered[language] = func
             return func
         return decorator
 
     @classmethod
     def get_generator(cls, language: str) -> Callable[[Dict[str, List[List[Union[str, int]]]]], str]:
-        if language not in cls._generators:
+        generator = cls._generators.get(language)
+        if generator is None:
             supported_languages = sorted(cls._generators.keys())
             raise ValueError(f"'{language}' not in supported languages {supported_languages}")
-        return cls._generators[language]
+        return generator
 
-def path_to_str(path: List[Union[str, int]]) -> str:
+# Same output as json.dumps with default arguments, without its per-call keyword checks
+_encode_json = json.JSONEncoder().encode
+
+# Fixed parts of the generated code, so each generator only formats the lines of its paths
+_PY_HEADER = "\n".join([
+    "import json",
+    "",
+    "with open(\"<yourfilepath>.json\", \"r\") as f:",
+    "    doc = json.load(f)",
+    "",
+    "result_doc = {",
+    ""
+])
+_PY_FOOTER = "}"
+_JS_HEADER = "\n".join([
+    "const fs = require('fs');",
+    "",
+    "const doc = JSON.parse(fs.readFileSync('<yourfilepath>.json', 'utf8'));",
+    "",
+    "const resultDoc = {"
+])
+_JS_FOOTER = "};"
+_MYSQL_HEADER = "\n".join([
+    "-- Assuming your JSON is stored in a column named 'json_data'",
+    "SELECT"
+])
+_SQL_FOOTER = "FROM your_table;"
+_PHP_HEADER = "\n".join([
+    "<?php",
+    "",
+    "$jsonString = file_get_contents('<yourfilepath>.json');",
+    "$doc = json_decode($jsonString, true);",
+    "",
+    "$resultDoc = ["
+])
+_PHP_FOOTER = "];"
+_PYSPARK_HEADER = "\n".join([
+    "from pyspark.sql import SparkSession",
+    "from pyspark.sql.functions import from_json, col",
+    "",
+    "# Initialize Spark session",
+    "spark = SparkSession.builder.appName('JSONExtraction').getOrCreate()",
+    "",
+    "# Read JSON file",
+    "df = spark.read.json('<yourfilepath>.json')",
+    "",
+    "# Extract fields"
+])
+_POSTGRESQL_HEADER = "\n".join([
+    "-- Assuming json_data is a JSONB column",
+    "SELECT"
+])
+_JAVA_HEADER = "\n".join([
+    "import org.json.JSONObject;",
+    "import java.nio.file.*;",
+    "",
+    "String content = Files.readString(Path.of(\"<yourfilepath>.json\"));",
+    "JSONObject doc = new JSONObject(content);",
+    "",
+    "JSONObject resultDoc = new JSONObject();"
+])
+_CPP_HEADER = "\n".join([
+    "#include <nlohmann/json.hpp>",
+    "#include <fstream>",
+    "",
+    "std::ifstream i(\"<yourfilepath>.json\");",
+    "nlohmann::json doc;",
+    "i >> doc;",
+    "",
+    "nlohmann::json resultDoc;"
+])
+_CSHARP_HEADER = "\n".join([
+    "using Newtonsoft.Json.Linq;",
+    "var json = File.ReadAllText(\"<yourfilepath>.json\");",
+    "var doc = JObject.Parse(json);",
+    "var resultDoc = new JObject();"
+])
+_GO_HEADER = "\n".join([
+    "import (",
+    "    \"encoding/json\"",
+    "    \"os\"",
+    ")",
+    "",
+    "var doc map[string]interface{}",
+    "file, _ := os.ReadFile(\"<yourfilepath>.json\")",
+    "json.Unmarshal(file, &doc)",
+    "",
+    "resultDoc := map[string]interface{}{}"
+])
+_RUST_HEADER = "\n".join([
+    "use serde_json::Value;",
+    "use std::fs;",
+    "",
+    "let data = fs::read_to_string(\"<yourfilepath>.json\").unwrap();",
+    "let doc: Value = serde_json::from_str(&data).unwrap();",
+    "",
+    "let mut result_doc = serde_json::Map::new();"
+])
+_SHELL_HEADER = "\n".join([
+    "#!/bin/bash",
+    "",
+    "jq '"
+])
+_SHELL_FOOTER = "<yourfilepath>.json"
+_RUBY_HEADER = "\n".join([
+    "require 'json'",
+    "",
+    "doc = JSON.parse(File.read('<yourfilepath>.json'))",
+    "result_doc = {}"
+])
+_R_HEADER = "\n".join([
+    "library(jsonlite)",
+    "doc <- fromJSON('<yourfilepath>.json')",
+    "result_doc <- list()"
+])
+_MATLAB_HEADER = "\n".join([
+    "fid = fopen('<yourfilepath>.json');",
+    "raw = fread(fid, inf);",
+    "str = char(raw');",
+    "fclose(fid);",
+    "doc = jsondecode(str);",
+    "result_doc = struct();"
+])
+_MONGODB_HEADER = "\n".join([
+    "// MongoDB aggregation pipeline to project specific fields",
+    "db.your_collection.aggregate([",
+    "  {",
+    "    $project: {"
+])
+_MONGODB_FOOTER = "\n".join([
+    "    }",
+    "  }",
+    "])"
+])
+
+@lru_cache(maxsize=4096)
+def _python_segment(p: Union[str, int]) -> str:
+    """Encode one path segment as a Python subscript; keys repeat across paths, so cache them."""
+    # Array indexes skip the encoder, whose int path is pure Python
+    if type(p) is int:
+        return "[%d]" % p
+    return "[%s]" % _encode_json(p)
+
+# Paths are short, so each renderer is compiled with straight-line code for
+# every depth up to this one and only loops over the segments of deeper paths
+_UNROLLED_PATH_DEPTH = 6
+
+def _make_path_renderer(
+    key_format: str,
+    index_format: str,
+    separator: str = "",
+    render_key: Optional[Callable[[str], str]] = None,
+    index_base: int = 0
+) -> Callable[[Tuple[Union[str, int], ...]], str]:
+    """
+    Compile a function that renders a path as the language's accessor string.
+
+    The segment formats are inlined into f-strings, and paths of up to
+    _UNROLLED_PATH_DEPTH segments are rendered by a function for their depth
+    that formats each segment in turn without a loop. Segments are told apart
+    by exact type, which is cheaper than isinstance; paths only hold plain str
+    keys and int indexes.
+
+    Args:
+        key_format (str): Format of a key segment, with {} standing for the key
+        index_format (str): Format of an index segment, with {} standing for the index
+        separator (str): Inserted between segments
+        render_key (Optional[Callable[[str], str]]): Applied to each key before formatting, if given
+        index_base (int): Added to each index, e.g. 1 for 1-based languages
+
+    Returns:
+        Callable[[Tuple[Union[str, int], ...]], str]: Function mapping a path tuple to its string
+    """
+    def segment(name: str) -> str:
+        key = f"_render_key({name})" if render_key else name
+        index = f"{name} + {index_base}" if index_base else name
+        return "(f%r if _type(%s) is _str else f%r)" % (
+            key_format.replace("{}", "{%s}" % key), name, index_format.replace("{}", "{%s}" % index)
+        )
+
+    lines = []
+    for depth in range(1, _UNROLLED_PATH_DEPTH + 1):
+        names = [f"p{i}" for i in range(depth)]
+        lines.append(f"def _render_{depth}({', '.join(names)}):")
+        lines.append(f"    return {separator!r}.join(({', '.join(map(segment, names))},))")
+    lines.extend([
+        f"_by_depth = (None, {', '.join(f'_render_{depth}' for depth in range(1, _UNROLLED_PATH_DEPTH + 1))})",
+        "def _render(path, _by_depth=_by_depth, _len=len):",
+        f"    if 0 < _len(path) <= {_UNROLLED_PATH_DEPTH}:",
+        "        return _by_depth[_len(path)](*path)",
+        f"    return {separator!r}.join([{segment('p')} for p in path])",
+    ])
+    namespace: Dict[str, Any] = {"_render_key": render_key, "_type": type, "_str": str}
+    exec(compile("\n".join(lines), "<path renderer>", "exec"), namespace)
+    return namespace["_render"]
+
+# The same paths are rendered again by repeated requests and when one set of
+# matches is turned into several languages, so the path strings of each
+# language are cached by path tuple.
+# Python and C++ subscripts, e.g. ["a"][0]
+_python_path = lru_cache(maxsize=4096)(_make_path_renderer("{}", "[{}]", render_key=_python_segment))
+# Single-quoted subscripts, e.g. ['a'][0], for JavaScript, PHP and Ruby
+_js_path = lru_cache(maxsize=4096)(_make_path_renderer("['{}']", "[{}]"))
+# Double-quoted subscripts, e.g. ["a"][0], for C#, Go and Rust
+_csharp_path = lru_cache(maxsize=4096)(_make_path_renderer('["{}"]', "[{}]"))
+# MySQL JSON path without the leading $, e.g. .a[0]
+_mysql_path = lru_cache(maxsize=4096)(_make_path_renderer(".{}", "[{}]"))
+# Dotted path with array indexes, e.g. .a[0], for Spark SQL, PySpark and jq
+_spark_path = lru_cache(maxsize=4096)(_make_path_renderer(".{}", "[{}]"))
+# PostgreSQL text array elements without the braces, e.g. a,0
+_pg_path = lru_cache(maxsize=4096)(_make_path_renderer("{}", "{}", separator=","))
+
+@lru_cache(maxsize=4096)
+def _java_path(path: Tuple[Union[str, int], ...]) -> str:
+    """org.json accessor chain, e.g. getJSONObject("a").get(0)."""
+    access = ".".join([f"getJSONObject(\"{p}\")" if type(p) is str else f"getJSONArray().get({p})" for p in path[:-1]])
+    final = f"get(\"{path[-1]}\")" if type(path[-1]) is str else f"get({path[-1]})"
+    return f"{access}.{final}"
+
+# R list subscripts with 1-based indexes, e.g. [['a']][[1]]
+_r_path = lru_cache(maxsize=4096)(_make_path_renderer("[['{}']]", "[[{}]]", index_base=1))
+# MATLAB struct fields with 1-based indexes, e.g. .a(1)
+_matlab_path = lru_cache(maxsize=4096)(_make_path_renderer(".{}", "({})", index_base=1))
+# MongoDB dotted field path, e.g. a.0
+_mongodb_path = lru_cache(maxsize=4096)(_make_path_renderer("{}", "{}", separator="."))
+
+def path_to_str(path: Sequence[Union[str, int]]) -> str:
     """Convert a path list to a string representation for Python code."""
-    return "".join(f"[{json.dumps(p)}]" for p in path)
+    return _python_path(tuple(path))
+
+def _make_line_emitter(
+    line_format: str,
+    render_path: Callable[[Tuple[Union[str, int], ...]], str],
+    path_first: bool = False,
+    render_keyword: Optional[Callable[[str], str]] = None
+) -> Callable[[Dict[str, List[List[Union[str, int]]]]], List[str]]:
+    """
+    Compile a function that formats one line of generated code per matched path.
+
+    The line format is inlined into the generated source as a constant and the
+    renderers are bound as default arguments, so the loop does no global or
+    attribute lookups.
+
+    Args:
+        line_format (str): %-format taking the keyword and the rendered path
+        render_path (Callable[[Tuple[Union[str, int], ...]], str]): Cached path renderer of the language
+        path_first (bool): Whether line_format takes the path before the keyword
+        render_keyword (Optional[Callable[[str], str]]): Applied to the keyword before formatting, if given
+
+    Returns:
+        Callable[[Dict[str, List[List[Union[str, int]]]]], List[str]]: Function mapping matches
+            to their lines, in order
+    """
+    keyword = "_render_keyword(keyword)" if render_keyword else "keyword"
+    path = "_render_path(_tuple(path))"
+    args = f"{path}, {keyword}" if path_first else f"{keyword}, {path}"
+    source = "\n".join([
+        "def _emit(matches, _render_path=_render_path, _render_keyword=_render_keyword, _tuple=tuple):",
+        f"    return [{line_format!r} % ({args}) for keyword, paths in matches.items() for path in paths]",
+    ])
+    namespace: Dict[str, Any] = {"_render_path": render_path, "_render_keyword": render_keyword}
+    exec(compile(source, "<line emitter>", "exec"), namespace)
+    return namespace["_emit"]
+
+_emit_python = _make_line_emitter("    \"%s\": doc%s,\n", _python_path)
+_emit_js = _make_line_emitter("    '%s': doc%s,", _js_path)
+_emit_mysql = _make_line_emitter("    JSON_UNQUOTE(JSON_EXTRACT(json_data, '$%s')) AS %s,", _mysql_path, path_first=True)
+_emit_spark_sql = _make_line_emitter("    get_json_object(json_data, '$%s') AS %s,", _spark_path, path_first=True)
+_emit_php = _make_line_emitter("    '%s' => $doc%s,", _js_path)
+_emit_pyspark = _make_line_emitter("df = df.withColumn('%s', col('%s'))", _spark_path)
+_emit_postgresql = _make_line_emitter("    json_data #>> '{%s}' AS \"%s\",", _pg_path, path_first=True)
+_emit_java = _make_line_emitter('resultDoc.put("%s", doc.%s);', _java_path)
+_emit_cpp = _make_line_emitter('resultDoc["%s"] = doc%s;', _python_path)
+_emit_csharp = _make_line_emitter('resultDoc["%s"] = doc%s;', _csharp_path)
+_emit_go = _make_line_emitter('resultDoc["%s"] = doc%s', _csharp_path)
+_emit_rust = _make_line_emitter('result_doc.insert("%s".to_string(), doc%s.clone());', _csharp_path)
+_emit_shell = _make_line_emitter("\"%s\": .%s", _spark_path)
+_emit_ruby = _make_line_emitter('result_doc["%s"] = doc%s', _js_path)
+_emit_r = _make_line_emitter('result_doc[["%s"]] <- doc%s', _r_path)
+_emit_matlab = _make_line_emitter('result_doc.%s = doc%s;', _matlab_path)
+_emit_mongodb = _make_line_emitter("      %s: '$%s',", _mongodb_path, render_keyword=_encode_json)
 
 @CodeGeneratorRegistry.register('python')
 def generate_extraction_code_python(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
@@ -33,19 +317,11 @@ def generate_extraction_code_python(matches: Dict[str, List[List[Union[str, int]
     Returns:
         str: Python code that extracts matching fields from the JSON object
     """
-    lines = [
-        "import json",
-        "",
-        "with open(\"<yourfilepath>.json\", \"r\") as f:",
-        "    doc = json.loads(f)",
-        "",
-        "result_doc = {"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            lines.append(f"    \"{keyword}\": doc{path_to_str(path)},")
-    lines.append("}")
-    return "\n".join(lines)
+    # Join everything at once, so the body isn't copied again by concatenation
+    lines = [_PY_HEADER]
+    lines.extend(_emit_python(matches))
+    lines.append(_PY_FOOTER)
+    return "".join(lines)
 
 @CodeGeneratorRegistry.register('javascript')
 def generate_extraction_code_js(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
@@ -58,18 +334,9 @@ def generate_extraction_code_js(matches: Dict[str, List[List[Union[str, int]]]])
     Returns:
         str: JavaScript code that extracts matching fields from the JSON object
     """
-    lines = [
-        "const fs = require('fs');",
-        "",
-        "const doc = JSON.parse(fs.readFileSync('<yourfilepath>.json', 'utf8'));",
-        "",
-        "const resultDoc = {"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            path_str = "".join(f"['{p}']" if isinstance(p, str) else f"[{p}]" for p in path)
-            lines.append(f"    '{keyword}': doc{path_str},")
-    lines.append("};")
+    lines = [_JS_HEADER]
+    lines.extend(_emit_js(matches))
+    lines.append(_JS_FOOTER)
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('mysql')
@@ -83,19 +350,11 @@ def generate_extraction_code_mysql(matches: Dict[str, List[List[Union[str, int]]
     Returns:
         str: MySQL code that extracts matching fields from the JSON object
     """
-    lines = [
-        "-- Assuming your JSON is stored in a column named 'json_data'",
-        "SELECT"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            json_path = '$' + ''.join(
-                f"[{p}]" if isinstance(p, int) else f".{p}" for p in path
-            )
-            lines.append(f"    JSON_UNQUOTE(JSON_EXTRACT(json_data, '{json_path}')) AS {keyword},")
+    lines = [_MYSQL_HEADER]
+    lines.extend(_emit_mysql(matches))
 
     lines[-1] = lines[-1].rstrip(',')
-    lines.append("FROM your_table;")
+    lines.append(_SQL_FOOTER)
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('spark_sql')
@@ -109,17 +368,11 @@ def generate_extraction_code_spark_sql(matches: Dict[str, List[List[Union[str, i
     Returns:
         str: Spark SQL code that extracts matching fields from the JSON object
     """
-    lines = [
-        "-- Assuming your JSON is stored in a column named 'json_data'",
-        "SELECT"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            path_str = "".join(f".{p}" if isinstance(p, str) else f"[{p}]" for p in path)
-            lines.append(f"    get_json_object(json_data, '${path_str}') AS {keyword},")
+    lines = [_MYSQL_HEADER]
+    lines.extend(_emit_spark_sql(matches))
     # Remove trailing comma from last line
     lines[-1] = lines[-1].rstrip(',')
-    lines.append("FROM your_table;")
+    lines.append(_SQL_FOOTER)
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('php')
@@ -133,19 +386,9 @@ def generate_extraction_code_php(matches: Dict[str, List[List[Union[str, int]]]]
     Returns:
         str: PHP code that extracts matching fields from the JSON object
     """
-    lines = [
-        "<?php",
-        "",
-        "$jsonString = file_get_contents('<yourfilepath>.json');",
-        "$doc = json_decode($jsonString, true);",
-        "",
-        "$resultDoc = ["
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            path_str = "".join(f"['{p}']" if isinstance(p, str) else f"[{p}]" for p in path)
-            lines.append(f"    '{keyword}' => $doc{path_str},")
-    lines.append("];")
+    lines = [_PHP_HEADER]
+    lines.extend(_emit_php(matches))
+    lines.append(_PHP_FOOTER)
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('pyspark')
@@ -159,206 +402,83 @@ def generate_extraction_code_pyspark(matches: Dict[str, List[List[Union[str, int
     Returns:
         str: PySpark code that extracts matching fields from the JSON object
     """
-    lines = [
-        "from pyspark.sql import SparkSession",
-        "from pyspark.sql.functions import from_json, col",
-        "",
-        "# Initialize Spark session",
-        "spark = SparkSession.builder.appName('JSONExtraction').getOrCreate()",
-        "",
-        "# Read JSON file",
-        "df = spark.read.json('<yourfilepath>.json')",
-        "",
-        "# Extract fields"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            path_str = "".join(f".{p}" if isinstance(p, str) else f"[{p}]" for p in path)
-            lines.append(f"df = df.withColumn('{keyword}', col('{path_str}'))")
+    lines = [_PYSPARK_HEADER]
+    lines.extend(_emit_pyspark(matches))
     
     lines.extend([
         "",
         "# Show results",
-        "df.select(" + ", ".join(f"'{k}'" for k in matches.keys()) + ").show()"
+        "df.select(" + ", ".join([f"'{k}'" for k in matches.keys()]) + ").show()"
     ])
     return "\n".join(lines)
 
 
 @CodeGeneratorRegistry.register('postgresql')
 def generate_extraction_code_postgresql(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "-- Assuming json_data is a JSONB column",
-        "SELECT"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            json_path = "{" + ",".join([str(p) if isinstance(p, int) else p for p in path]) + "}"
-            lines.append(f"    json_data #>> '{json_path}' AS \"{keyword}\",")
+    lines = [_POSTGRESQL_HEADER]
+    lines.extend(_emit_postgresql(matches))
     lines[-1] = lines[-1].rstrip(',')
-    lines.append("FROM your_table;")
+    lines.append(_SQL_FOOTER)
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('java')
 def generate_extraction_code_java(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "import org.json.JSONObject;",
-        "import java.nio.file.*;",
-        "",
-        "String content = Files.readString(Path.of(\"<yourfilepath>.json\"));",
-        "JSONObject doc = new JSONObject(content);",
-        "",
-        "JSONObject resultDoc = new JSONObject();"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            access = ".".join([f"getJSONObject(\"{p}\")" if isinstance(p, str) else f"getJSONArray().get({p})" for p in path[:-1]])
-            final = f"get(\"{path[-1]}\")" if isinstance(path[-1], str) else f"get({path[-1]})"
-            lines.append(f'resultDoc.put("{keyword}", doc.{access}.{final});')
+    lines = [_JAVA_HEADER]
+    lines.extend(_emit_java(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('c++')
 def generate_extraction_code_cpp(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "#include <nlohmann/json.hpp>",
-        "#include <fstream>",
-        "",
-        "std::ifstream i(\"<yourfilepath>.json\");",
-        "nlohmann::json doc;",
-        "i >> doc;",
-        "",
-        "nlohmann::json resultDoc;"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            cpp_path = "".join([f"[{json.dumps(p)}]" for p in path])
-            lines.append(f'resultDoc["{keyword}"] = doc{cpp_path};')
+    lines = [_CPP_HEADER]
+    lines.extend(_emit_cpp(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('c#')
 def generate_extraction_code_csharp(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "using Newtonsoft.Json.Linq;",
-        "var json = File.ReadAllText(\"<yourfilepath>.json\");",
-        "var doc = JObject.Parse(json);",
-        "var resultDoc = new JObject();"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            access = "".join([f"[\"{p}\"]" if isinstance(p, str) else f"[{p}]" for p in path])
-            lines.append(f'resultDoc["{keyword}"] = doc{access};')
+    lines = [_CSHARP_HEADER]
+    lines.extend(_emit_csharp(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('go')
 def generate_extraction_code_go(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "import (",
-        "    \"encoding/json\"",
-        "    \"os\"",
-        ")",
-        "",
-        "var doc map[string]interface{}",
-        "file, _ := os.ReadFile(\"<yourfilepath>.json\")",
-        "json.Unmarshal(file, &doc)",
-        "",
-        "resultDoc := map[string]interface{}{}"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            access = "".join([f"[\"{p}\"]" if isinstance(p, str) else f"[{p}]" for p in path])
-            lines.append(f'resultDoc["{keyword}"] = doc{access}')
+    lines = [_GO_HEADER]
+    lines.extend(_emit_go(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('rust')
 def generate_extraction_code_rust(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "use serde_json::Value;",
-        "use std::fs;",
-        "",
-        "let data = fs::read_to_string(\"<yourfilepath>.json\").unwrap();",
-        "let doc: Value = serde_json::from_str(&data).unwrap();",
-        "",
-        "let mut result_doc = serde_json::Map::new();"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            access = "".join([f"[\"{p}\"]" if isinstance(p, str) else f"[{p}]" for p in path])
-            lines.append(f'result_doc.insert("{keyword}".to_string(), doc{access}.clone());')
+    lines = [_RUST_HEADER]
+    lines.extend(_emit_rust(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('shell')
 def generate_extraction_code_shell(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "#!/bin/bash",
-        "",
-        "jq '"
-    ]
-    filters = []
-    for keyword, paths in matches.items():
-        for path in paths:
-            jq_path = "." + "".join([f".{p}" if isinstance(p, str) else f"[{p}]" for p in path])
-            filters.append(f"\"{keyword}\": {jq_path}")
-    lines.append("{ " + ", ".join(filters) + " }'")
-    lines.append("<yourfilepath>.json")
-    return "\n".join(lines)
+    filters = _emit_shell(matches)
+    return "\n".join([_SHELL_HEADER, "{ " + ", ".join(filters) + " }'", _SHELL_FOOTER])
 
 @CodeGeneratorRegistry.register('ruby')
 def generate_extraction_code_ruby(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "require 'json'",
-        "",
-        "doc = JSON.parse(File.read('<yourfilepath>.json'))",
-        "result_doc = {}"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            access = "".join([f"['{p}']" if isinstance(p, str) else f"[{p}]" for p in path])
-            lines.append(f'result_doc["{keyword}"] = doc{access}')
+    lines = [_RUBY_HEADER]
+    lines.extend(_emit_ruby(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('r')
 def generate_extraction_code_r(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "library(jsonlite)",
-        "doc <- fromJSON('<yourfilepath>.json')",
-        "result_doc <- list()"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            access = "".join([f"[['{p}']]" if isinstance(p, str) else f"[[{p+1}]]" for p in path])
-            lines.append(f'result_doc[["{keyword}"]] <- doc{access}')
+    lines = [_R_HEADER]
+    lines.extend(_emit_r(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('matlab')
 def generate_extraction_code_matlab(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "fid = fopen('<yourfilepath>.json');",
-        "raw = fread(fid, inf);",
-        "str = char(raw');",
-        "fclose(fid);",
-        "doc = jsondecode(str);",
-        "result_doc = struct();"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            access = "".join([f".{p}" if isinstance(p, str) else f"({p+1})" for p in path])
-            lines.append(f'result_doc.{keyword} = doc{access};')
+    lines = [_MATLAB_HEADER]
+    lines.extend(_emit_matlab(matches))
     return "\n".join(lines)
 
 @CodeGeneratorRegistry.register('mongodb')
 def generate_extraction_code_mongodb(matches: Dict[str, List[List[Union[str, int]]]]) -> str:
-    lines = [
-        "// MongoDB aggregation pipeline to project specific fields",
-        "db.your_collection.aggregate([",
-        "  {",
-        "    $project: {"
-    ]
-    for keyword, paths in matches.items():
-        for path in paths:
-            dot_path = "".join([f".{p}" if isinstance(p, str) else f".{p}" for p in path])[1:]
-            lines.append(f"      {json.dumps(keyword)}: '${dot_path}',")
+    lines = [_MONGODB_HEADER]
+    lines.extend(_emit_mongodb(matches))
     if lines[-1].endswith(','):
         lines[-1] = lines[-1].rstrip(',')
-    lines.append("    }")
-    lines.append("  }")
-    lines.append("])")
+    lines.append(_MONGODB_FOOTER)
     return "\n".join(lines)
\ No newline at end of file
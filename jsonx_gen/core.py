@@ -4,21 +4,191 @@ Core functionality for JSON extraction code generation.
 
 import json
 import os
-import json_stream
-from typing import Any, Dict, List, Union, Optional
+import stat
+import sys
+import ijson
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, reduce
+from operator import getitem
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union, Optional
 from .utils import (
-    get_matcher,
+    build_matcher,
     is_valid_url,
+    loads_json,
     parse_json_input,
     validate_extraction_params,
-    get_key_with_extension
+    label_matches,
+    gc_paused
 )
 from .code_generator_registry import CodeGeneratorRegistry
 
+# Language -> generator, a read-only view that follows later registrations
+_GENERATORS = CodeGeneratorRegistry._generators
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
 # Define threshold for large files (10MB)
 LARGE_FILE_THRESHOLD = 10 * 1024 * 1024  # 10MB in bytes
 # LARGE_FILE_THRESHOLD = 10
 
+# Bytes read to decide whether a large file is newline-delimited JSON (1MB)
+NDJSON_SNIFF_SIZE = 1024 * 1024
+
+# Distinct string values whose keyword hits are remembered per traversal
+VALUE_HITS_CACHE_SIZE = 4096
+
+# Types of JSON primitives; exact type lookups are cheaper than isinstance with
+# a tuple, and parsed JSON never contains subclasses of them
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool})
+# The extraction functions take a parameter named type, so keep the builtin reachable
+_type = type
+
+# simdjson holds the whole file plus its tape in memory, so larger files keep
+# using the constant-memory ijson parser
+SIMDJSON_MAX_FILE_SIZE = 1024 * 1024 * 1024  # 1GB in bytes
+
+# Paths deeper than this are looked up in a loop by the compiled extractors
+EXTRACTOR_MAX_INLINE_DEPTH = 100
+
+
+def _value_text(value: Union[str, int, float, bool]) -> str:
+    """
+    Lowercase a primitive JSON value for matching.
+
+    Numbers are already lowercase as text ('1e-05', 'inf'), so only strings and
+    booleans are lowercased.
+
+    Args:
+        value (Union[str, int, float, bool]): A value whose exact type is in _PRIMITIVE_TYPES
+
+    Returns:
+        str: The lowercased text of the value
+    """
+    value_type = _type(value)
+    if value_type is str:
+        return value.lower()
+    if value_type is bool:
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _intern_paths(found: Dict[str, List[List[Union[str, int]]]]) -> None:
+    """
+    Intern the keys of the paths in found, in place.
+
+    Parsers that create a new string for every occurrence of a key would
+    otherwise leave each recorded path with its own copies of the keys.
+
+    Args:
+        found: Keywords mapped to their paths
+    """
+    intern = sys.intern
+    for paths in found.values():
+        for path in paths:
+            path[:] = [intern(p) if _type(p) is str else p for p in path]
+
+
+def _collect_paths(
+    json_obj: Any,
+    find: Callable[[str], List[str]],
+    type: str,
+    found: Dict[str, List[List[Union[str, int]]]],
+    key_hits: Dict[Any, List[str]],
+    root: Tuple[Union[str, int], ...] = (),
+    value_hits: Optional[Dict[str, List[str]]] = None,
+    find_value: Optional[Callable[[str], List[str]]] = None,
+    object_type: Any = dict,
+    array_type: Any = list,
+    object_items: Callable[[Any], Iterable[Tuple[Any, Any]]] = dict.items
+) -> None:
+    """
+    Append the path of every key/value of json_obj matching a keyword to found.
+
+    Args:
+        json_obj: The JSON object to analyze
+        find: Matcher built by build_matcher
+        type: What to match ('all', 'key', or 'value')
+        found: Keywords mapped to the paths found so far, in document order
+        key_hits: Cache of keyword hits per object key, shared between calls
+        root: Path prepended to every recorded path
+        value_hits: Cache of keyword hits per string value, filled up to
+            VALUE_HITS_CACHE_SIZE entries; None to match every value afresh
+        find_value: Matcher for values, if it differs from find
+        object_type: Type of the objects of json_obj, e.g. simdjson.Object
+        array_type: Type of the arrays of json_obj, e.g. simdjson.Array
+        object_items: Returns the (key, value) pairs of an object
+    """
+    # Each stack entry holds the remaining children of one container, so the walk
+    # resumes where it left off and visits nodes in the same depth-first order as
+    # a recursive search. path holds the keys of the containers on the stack:
+    # a key is pushed when entering a container and popped when leaving it, so
+    # paths are only copied for matches.
+    stack: List[Tuple[bool, Iterator[Tuple[Any, Any]]]] = []
+    if isinstance(json_obj, object_type):
+        stack.append((True, iter(object_items(json_obj))))
+    elif isinstance(json_obj, array_type):
+        stack.append((False, iter(enumerate(json_obj))))
+    path: List[Union[str, int]] = list(root)
+
+    # Bind hot builtins and methods to locals for the loop below
+    _isinstance, _str, _bool, _iter, _enumerate = isinstance, str, bool, iter, enumerate
+    get_type, none_type = _type, _type(None)
+    leaves = _PRIMITIVE_TYPES | {none_type}
+    push, get_key_hits = stack.append, key_hits.get
+    # Only strings are cached: True, 1 and 1.0 are equal as dict keys
+    cache_values = value_hits is not None
+    get_value_hits = value_hits.get if cache_values else None
+    enter, leave = path.append, path.pop
+    check_key, check_value = type in ('all', 'key'), type in ('all', 'value')
+    find_value = find_value or find
+
+    while stack:
+        is_dict, children = stack[-1]
+        for k, v in children:
+            # Check if keywords match the key
+            if is_dict and check_key:
+                hits = get_key_hits(k)
+                if hits is None:
+                    hits = key_hits[k] = find(k.lower() if _isinstance(k, str) else _str(k).lower())
+                for keyword in hits:
+                    found[keyword].append(path + [k])
+            # Check if keywords match the value (for primitive types). Leaves are
+            # told apart by exact type first, so they skip the container checks
+            value_type = get_type(v)
+            if value_type in leaves:
+                if not check_value or value_type is none_type:
+                    continue
+                # Same as find(_value_text(v)), inlined; repeated strings reuse their hits
+                if value_type is _str:
+                    hits = get_value_hits(v) if cache_values else None
+                    if hits is None:
+                        hits = find_value(v.lower())
+                        if cache_values and len(value_hits) < VALUE_HITS_CACHE_SIZE:
+                            value_hits[v] = hits
+                elif value_type is _bool:
+                    hits = find_value('true' if v else 'false')
+                else:
+                    hits = find_value(_str(v))
+                for keyword in hits:
+                    found[keyword].append(path + [k])
+            elif _isinstance(v, object_type):
+                push((True, _iter(object_items(v))))
+                enter(k)
+                break
+            elif _isinstance(v, array_type):
+                push((False, _iter(_enumerate(v))))
+                enter(k)
+                break
+        else:
+            stack.pop()
+            # The root container has no key of its own
+            if stack:
+                leave()
+
 
 def extract_json_path(
     json_obj: Union[Dict, List], 
@@ -38,46 +208,125 @@ def extract_json_path(
     Returns:
         Dict[str, List[List[Union[str, int]]]]: Dictionary mapping keywords to their paths
     """
-    keywords = list(set(keywords))
-    matches: Dict[str, List[List[Union[str, int]]]] = {}
-    keyword_counts: Dict[str, int] = {k: 0 for k in keywords}
-    matcher = get_matcher(mode)
+    keywords = list(dict.fromkeys(keywords))
+    found: Dict[str, List[List[Union[str, int]]]] = {k: [] for k in keywords}
+    find = build_matcher(keywords, mode)
+    # Object keys repeat across records, so their hits are computed once per call;
+    # so do many string values, unless matching them is a plain lookup anyway
+    with gc_paused():
+        _collect_paths(json_obj, find, type, found, {}, value_hits=None if mode.lower() == 'match' else {})
+        return label_matches(found)
 
-    def search(obj: Any, path: List[Union[str, int]]) -> None:
-        """
-        Recursively search through the JSON object for keywords.
-        
-        Args:
-            obj: Current object being searched
-            path: Current path in the JSON structure
-        """
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                for keyword in keywords:
-                    # Check if keyword matches the key
-                    if type in ['all', 'key'] and matcher(str(k), keyword):
-                        key = get_key_with_extension(keyword, keyword_counts)
-                        matches.setdefault(key, []).append(path + [k])
-                    # Check if keyword matches the value (for primitive types)
-                    if type in ['all', 'value'] and isinstance(v, (str, int, float)) and matcher(str(v), keyword):
-                        key = get_key_with_extension(keyword, keyword_counts)
-                        matches.setdefault(key, []).append(path + [k])
-                search(v, path + [k])
-        elif isinstance(obj, list):
-            for idx, item in enumerate(obj):
-                # match value and item is atomic
-                if type in ['all', 'value'] and isinstance(item, (str, int, float)):
-                    for keyword in keywords:
-                        if matcher(str(item), keyword):
-                            key = get_key_with_extension(keyword, keyword_counts)
-                            matches.setdefault(key, []).append(path + [idx])
-                else:
-                    # item is dict or list
-                    search(item, path + [idx])
 
-    # Start the search from the root
-    search(json_obj, [])
-    return dict(sorted(matches.items()))
+@lru_cache(maxsize=128)
+def _compile_extractor(
+    paths: Tuple[Tuple[str, Tuple[Tuple[Union[str, int], ...], ...]], ...]
+) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Compile a function that returns the values at the given labeled paths of a document.
+
+    The generated function indexes the document directly, like the Python code produced
+    by generate_extraction_code, so applying it costs a few subscripts per field.
+
+    Args:
+        paths: Labels paired with their paths, as frozen from the result of extract_json_path
+
+    Returns:
+        Callable[[Any], Dict[str, Any]]: Function mapping a document to {label: value};
+            a label with several paths maps to the list of their values
+    """
+    fields = []
+    for label, label_paths in paths:
+        # Python compiles nested subscripts recursively, so very deep paths are
+        # looked up in a loop instead of being written out
+        accessors = [
+            "doc" + "".join([f"[{p!r}]" for p in path]) if len(path) <= EXTRACTOR_MAX_INLINE_DEPTH
+            else f"_reduce(_getitem, {path!r}, doc)"
+            for path in label_paths
+        ]
+        value = accessors[0] if len(accessors) == 1 else "[" + ", ".join(accessors) + "]"
+        fields.append(f"        {label!r}: {value},")
+    source = "\n".join(["def _extract(doc):", "    return {", *fields, "    }"])
+    namespace: Dict[str, Any] = {"_reduce": reduce, "_getitem": getitem}
+    exec(compile(source, "<extractor>", "exec"), namespace)
+    return namespace["_extract"]
+
+
+def _collect_paths_ijson(
+    file: Any,
+    find: Callable[[str], List[str]],
+    type: str,
+    found: Dict[str, List[List[Union[str, int]]]],
+    value_hits: Optional[Dict[str, List[str]]] = None,
+    backend: Any = ijson
+) -> None:
+    """
+    Append the path of every key/value matching a keyword to found, streaming a binary file.
+
+    ijson's dotted prefixes don't distinguish keys from indexes, so the file is
+    read as basic parse events, which skip building them, and the path is kept
+    up to date from the events: each key is checked when it is read and each
+    primitive value as it is parsed, and paths are only copied for matches. A
+    value records only its first hit.
+
+    Args:
+        file: File object opened in binary mode
+        find: Matcher built by build_matcher
+        type: What to match ('all', 'key', or 'value')
+        found: Keywords mapped to the paths found so far, in document order
+        value_hits: Cache of the hit per string value, filled up to
+            VALUE_HITS_CACHE_SIZE entries; None to match every value afresh
+        backend: ijson backend to parse with, by default the fastest one installed
+
+    Raises:
+        ijson.JSONError: If the document is invalid JSON
+    """
+    # The key or index of the current child of each open container, and whether
+    # that container is an array
+    path: List[Any] = []
+    is_array: List[bool] = []
+    # Every distinct key is stored once, together with its keyword hits, so the
+    # paths recorded in found share their key strings
+    known_keys: Dict[str, Tuple[str, List[str]]] = {}
+    check_key, check_value = type in ('all', 'key'), type in ('all', 'value')
+    cache_values = value_hits is not None
+
+    for event, value in backend.basic_parse(file, use_float=True):
+        if event == 'map_key':
+            entry = known_keys.get(value)
+            if entry is None:
+                entry = known_keys[value] = (value, find(value.lower()) if check_key else [])
+            path[-1], hits = entry
+            for keyword in hits:
+                found[keyword].append(path.copy())
+            continue
+        if event == 'end_map' or event == 'end_array':
+            path.pop()
+            is_array.pop()
+            continue
+        # Every other event starts a value; inside an array it is the next item
+        if is_array and is_array[-1]:
+            path[-1] += 1
+        if event == 'start_map' or event == 'start_array':
+            path.append(None if event == 'start_map' else -1)
+            is_array.append(event == 'start_array')
+        elif check_value and value is not None:
+            if event == 'string':
+                hits = value_hits.get(value) if cache_values else None
+                if hits is None:
+                    hits = find(value.lower())[:1]
+                    if cache_values and len(value_hits) < VALUE_HITS_CACHE_SIZE:
+                        value_hits[value] = hits
+            else:
+                hits = find(_value_text(value))
+            if hits:
+                found[hits[0]].append(path.copy())
+
+
+def _simdjson_items(obj: Any) -> Iterator[Tuple[str, Any]]:
+    """(key, value) pairs of a simdjson object, keeping nested containers as lazy proxies."""
+    # Object.items() would convert every value to Python objects up front
+    return ((k, obj[k]) for k in obj.keys())
 
 
 def extract_json_path_streaming(
@@ -89,6 +338,10 @@ def extract_json_path_streaming(
     """
     Extract paths from a streaming JSON file that match the given keywords.
 
+    The file is walked through simdjson's lazy proxies when pysimdjson is installed
+    and the file is at most SIMDJSON_MAX_FILE_SIZE; otherwise it is streamed with ijson.
+    Either way the values are only turned into Python objects one at a time.
+
     Args:
         file_path (str): Path to the JSON file
         keywords (List[str]): List of keywords to search for in keys and/or values
@@ -97,52 +350,246 @@ def extract_json_path_streaming(
 
     Returns:
         Dict[str, List[List[Union[str, int]]]]: Dictionary mapping keywords to their matched paths
+
+    Raises:
+        ValueError: If the file is invalid JSON
+    """
+    keywords = list(dict.fromkeys(keywords))
+    found: Dict[str, List[List[Union[str, int]]]] = {k: [] for k in keywords}
+    find = build_matcher(keywords, mode)
+    cache_values = mode.lower() != 'match'
+
+    use_simdjson = SIMDJSON_AVAILABLE and os.path.getsize(file_path) <= SIMDJSON_MAX_FILE_SIZE
+    if use_simdjson:
+        try:
+            doc = simdjson.Parser().load(file_path)
+        except RuntimeError as e:
+            # simdjson only parses 64-bit integers and documents up to 1024 levels
+            # deep; ijson takes bigger integers and any depth
+            if 'BIGINT' not in str(e) and 'DEPTH' not in str(e):
+                raise
+            use_simdjson = False
+
+    if use_simdjson:
+        if isinstance(doc, (simdjson.Object, simdjson.Array)):
+            # The lazy proxies are walked like parsed objects; as when streaming
+            # with ijson, a value only records its first hit
+            _collect_paths(
+                doc, find, type, found, {},
+                value_hits={} if cache_values else None,
+                find_value=lambda s: find(s)[:1],
+                object_type=simdjson.Object,
+                array_type=simdjson.Array,
+                object_items=_simdjson_items
+            )
+            _intern_paths(found)
+        elif type in ('all', 'value') and _type(doc) in _PRIMITIVE_TYPES:
+            for keyword in find(_value_text(doc))[:1]:
+                found[keyword].append([])
+    else:
+        try:
+            try:
+                with open(file_path, 'rb') as f:
+                    _collect_paths_ijson(f, find, type, found, {} if cache_values else None)
+            except ijson.JSONError as e:
+                # yajl, behind ijson's C backend, only parses 64-bit integers;
+                # start over with the pure Python backend for bigger ones
+                if 'integer overflow' not in str(e):
+                    raise
+                for paths in found.values():
+                    paths.clear()
+                with open(file_path, 'rb') as f:
+                    _collect_paths_ijson(
+                        f, find, type, found, {} if cache_values else None, ijson.get_backend('python')
+                    )
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON input: {str(e)}")
+
+    return label_matches(found)
+
+
+def _is_ndjson(file_path: str) -> bool:
+    """
+    Check whether a file holds newline-delimited JSON records.
+
+    The file counts as NDJSON if its first line is a complete JSON value and more
+    data follows it; a pretty-printed or single-line document does not qualify.
+
+    Args:
+        file_path (str): Path to the file
+
+    Returns:
+        bool: True if the file looks like NDJSON
+    """
+    with open(file_path, 'rb') as f:
+        first = f.readline(NDJSON_SNIFF_SIZE)
+        if not first.endswith(b'\n'):
+            return False
+        try:
+            loads_json(first)
+        except ValueError:
+            return False
+        return bool(f.read(NDJSON_SNIFF_SIZE).strip())
+
+
+def _ndjson_ranges(file_path: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into up to parts byte ranges that each start at the beginning of a line.
+
+    Args:
+        file_path (str): Path to the file
+        parts (int): Number of ranges to aim for
+
+    Returns:
+        List[Tuple[int, int]]: Non-empty (start, end) byte ranges covering the file
+    """
+    size = os.path.getsize(file_path)
+    bounds = [0]
+    with open(file_path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            # Move to the start of the next line
+            f.readline()
+            bounds.append(f.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def _extract_ndjson_range(
+    file_path: str,
+    start: int,
+    end: int,
+    keywords: List[str],
+    mode: str,
+    type: str
+) -> Tuple[int, Dict[str, List[List[Union[str, int]]]]]:
+    """
+    Collect the matching paths of the NDJSON records whose lines start in [start, end).
+
+    Runs in a worker process, so it only takes picklable arguments.
+
+    Returns:
+        Tuple[int, Dict[str, List[List[Union[str, int]]]]]: Number of records read and the
+            keywords mapped to their paths, which start with the record index within the range
     """
-    keywords = list(set(keywords))
-    matches: Dict[str, List[List[Union[str, int]]]] = {}
-    keyword_counts: Dict[str, int] = {k: 0 for k in keywords}
-    matcher = get_matcher(mode)
-    prev_path: List[Union[str, int]] = []
-
-    def visitor(item: Any, path: tuple):
-        nonlocal prev_path
-        path = list(path)
-
-        # compute delta
-        i = 0
-        while i < len(path) and i < len(prev_path) and path[i] == prev_path[i]:
-            i += 1
-        delta = path[i:]
-        base_path = path[:i]
-
-        # only process unmatched suffix for keys
-        if type in ['all', 'key']:
-            for j, part in enumerate(delta):
-                if isinstance(part, str):
-                    for keyword in keywords:
-                        if matcher(part, keyword):
-                            key = get_key_with_extension(keyword, keyword_counts)
-                            matches.setdefault(key, []).append(base_path + delta[:j+1])
-                            # break
-                    else:
-                        # jump to next part
-                        continue
-                    break
-
-        # check value
-        if type in ['all', 'value'] and isinstance(item, (str, int, float)):
-            for keyword in keywords:
-                if matcher(str(item), keyword):
-                    key = get_key_with_extension(keyword, keyword_counts)
-                    matches.setdefault(key, []).append(path)
-                    break
-
-        prev_path = path
-
-    with open(file_path, 'r') as f:
-        json_stream.visit(f, visitor)
-
-    return dict(sorted(matches.items()))
+    find = build_matcher(keywords, mode)
+    found: Dict[str, List[List[Union[str, int]]]] = {k: [] for k in keywords}
+    key_hits: Dict[Any, List[str]] = {}
+    value_hits = None if mode.lower() == 'match' else {}
+    count = 0
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            if line.strip():
+                _collect_paths(loads_json(line), find, type, found, key_hits, (count,), value_hits)
+                count += 1
+    # Each record is parsed separately, so without orjson's key cache every match
+    # holds its own copies of the keys; shared keys also let pickle send each once
+    _intern_paths(found)
+    return count, found
+
+
+def extract_json_path_ndjson(
+    file_path: str,
+    keywords: List[str],
+    mode: str = 'match',
+    type: str = 'all',
+    max_workers: Optional[int] = None
+) -> Dict[str, List[List[Union[str, int]]]]:
+    """
+    Extract paths from a newline-delimited JSON file, searching chunks of records in parallel.
+
+    Every non-empty line is a record and paths start with its index, as if the records
+    were the items of a top-level array. The file is split into ranges of whole lines
+    that are searched in worker processes, and the results are merged in file order so
+    labels number the matches as a single pass would.
+
+    Args:
+        file_path (str): Path to the NDJSON file
+        keywords (List[str]): List of keywords to search for in keys and/or values
+        mode (str): Matching mode ('match', 'contains', 'startswith', or 'endswith')
+        type (str): What to match ('all', 'key', or 'value')
+        max_workers (Optional[int]): Number of worker processes (None for one per CPU)
+
+    Returns:
+        Dict[str, List[List[Union[str, int]]]]: Dictionary mapping keywords to their matched paths
+
+    Raises:
+        json.JSONDecodeError: If a line is not valid JSON
+    """
+    keywords = list(dict.fromkeys(keywords))
+    ranges = _ndjson_ranges(file_path, max_workers or os.cpu_count() or 1)
+    args = [(file_path, start, end, keywords, mode, type) for start, end in ranges]
+
+    if len(ranges) > 1:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            results = list(executor.map(_extract_ndjson_range, *zip(*args)))
+    else:
+        results = [_extract_ndjson_range(*a) for a in args]
+
+    found: Dict[str, List[List[Union[str, int]]]] = {k: [] for k in keywords}
+    offset = 0
+    for count, chunk_found in results:
+        for keyword, paths in chunk_found.items():
+            for path in paths:
+                path[0] += offset
+            found[keyword].extend(paths)
+        offset += count
+    return label_matches(found)
+
+
+def _find_matches(
+    json_input: Union[str, Dict, List],
+    keywords: List[str],
+    mode: str,
+    type: str
+) -> Dict[str, List[List[Union[str, int]]]]:
+    """
+    Validate the parameters and extract the labeled paths matching the keywords.
+
+    Files above LARGE_FILE_THRESHOLD are searched in NDJSON chunks or streamed
+    instead of being parsed into memory.
+
+    Args:
+        json_input: Either a JSON string, file path, URL, or parsed JSON object
+        keywords: List of keywords to search for
+        mode: Matching mode ('match', 'contains', 'startswith', or 'endswith')
+        type: What to match ('all', 'key', or 'value')
+
+    Returns:
+        Dict[str, List[List[Union[str, int]]]]: Dictionary mapping labels to their paths
+
+    Raises:
+        ValueError: If any of the input parameters are invalid or the input is invalid JSON
+    """
+    # Validate input parameters
+    validate_extraction_params(keywords, mode, type)
+
+    # A single stat tells both whether the input is a file and how large it is
+    use_streaming = False
+    if isinstance(json_input, str):
+        try:
+            st = os.stat(json_input)
+            use_streaming = stat.S_ISREG(st.st_mode) and st.st_size > LARGE_FILE_THRESHOLD
+        except (OSError, ValueError):
+            # Not a path, e.g. a URL or a JSON string
+            pass
+
+    try:
+        if use_streaming and _is_ndjson(json_input):
+            return extract_json_path_ndjson(json_input, keywords, mode, type)
+        elif use_streaming:
+            return extract_json_path_streaming(json_input, keywords, mode, type)
+        else:
+            json_obj = parse_json_input(json_input)
+            return extract_json_path(json_obj, keywords, mode, type)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON input: {str(e)}")
 
 
 def generate_extraction_code(
@@ -168,23 +615,7 @@ def generate_extraction_code(
     Raises:
         ValueError: If any of the input parameters are invalid
     """
-    # Validate input parameters
-    validate_extraction_params(keywords, mode, type)
-
-    use_streaming = (
-        isinstance(json_input, str)
-        and os.path.isfile(json_input)
-        and os.path.getsize(json_input) > LARGE_FILE_THRESHOLD
-        )
-
-    if use_streaming:
-        matches = extract_json_path_streaming(json_input, keywords, mode, type)
-    else:
-        try:
-            json_obj = parse_json_input(json_input)
-            matches = extract_json_path(json_obj, keywords, mode, type)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON input: {str(e)}")
+    matches = _find_matches(json_input, keywords, mode, type)
             
     if not matches:
         return "# No matches found for the given keywords"
@@ -192,7 +623,100 @@ def generate_extraction_code(
     # Get the appropriate generator and generate code
     language = target_language or 'python'
     try:
-        generator = CodeGeneratorRegistry.get_generator(language)
+        generator = _GENERATORS.get(language) or CodeGeneratorRegistry.get_generator(language)
         return generator(matches)
     except ValueError as e:
-        raise ValueError(f"Error generating code: {str(e)}") 
\ No newline at end of file
+        raise ValueError(f"Error generating code: {str(e)}") 
+
+
+def generate_all(
+    json_input: Union[str, Dict, List],
+    keywords: List[str],
+    mode: str = 'match',
+    type: str = 'all',
+    languages: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None
+) -> Dict[str, str]:
+    """
+    Generate extraction code for several target languages from one search of the input.
+
+    The input is searched once and the generators, which are independent and
+    stateless, run in a thread pool. They are pure Python, so the threads mostly
+    overlap where the interpreter releases the GIL.
+
+    Args:
+        json_input: Either a JSON string, file path, or parsed JSON object
+        keywords: List of keywords to search for
+        mode: Matching mode ('match', 'contains', 'startswith', or 'endswith')
+        type: What to match ('all', 'key', or 'value')
+        languages: Target languages (None for every registered language)
+        max_workers: Number of threads (None for up to 8)
+
+    Returns:
+        Dict[str, str]: Generated extraction code by language, in the order requested
+
+    Raises:
+        ValueError: If any of the input parameters or languages are invalid
+    """
+    languages = sorted(_GENERATORS) if languages is None else list(dict.fromkeys(languages))
+    try:
+        generators = [_GENERATORS.get(language) or CodeGeneratorRegistry.get_generator(language) for language in languages]
+    except ValueError as e:
+        raise ValueError(f"Error generating code: {str(e)}")
+
+    matches = _find_matches(json_input, keywords, mode, type)
+    if not matches:
+        return {language: "# No matches found for the given keywords" for language in languages}
+
+    if not generators:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, len(generators))) as executor:
+        codes = list(executor.map(lambda generator: generator(matches), generators))
+    return dict(zip(languages, codes))
+
+
+def extract_many(
+    docs: Iterable[Union[Dict, List]],
+    keywords: List[str],
+    mode: str = 'match',
+    type: str = 'all'
+) -> List[Dict[str, Any]]:
+    """
+    Extract the fields matching the given keywords from many documents of the same shape.
+
+    The first document is searched with extract_json_path and the matching paths are
+    compiled into a function that reads them from each following document directly.
+    A document the compiled paths do not fit is searched on its own and its paths are
+    compiled in turn. Value matches are decided on the searched document, so the
+    same fields are read from the documents that follow it.
+
+    Args:
+        docs: Parsed JSON documents
+        keywords: List of keywords to search for
+        mode: Matching mode ('match', 'contains', 'startswith', or 'endswith')
+        type: What to match ('all', 'key', or 'value')
+
+    Returns:
+        List[Dict[str, Any]]: For each document, the matched labels mapped to their values
+
+    Raises:
+        ValueError: If any of the input parameters are invalid
+    """
+    validate_extraction_params(keywords, mode, type)
+
+    results: List[Dict[str, Any]] = []
+    extractor: Optional[Callable[[Any], Dict[str, Any]]] = None
+    for doc in docs:
+        if extractor is not None:
+            try:
+                results.append(extractor(doc))
+                continue
+            except (KeyError, IndexError, TypeError):
+                # The document has a different shape
+                pass
+        matches = extract_json_path(doc, keywords, mode, type)
+        extractor = _compile_extractor(tuple(
+            (label, tuple(tuple(path) for path in paths)) for label, paths in matches.items()
+        ))
+        results.append(extractor(doc))
+    return results
\ No newline at end of file
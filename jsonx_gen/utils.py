@@ -2,37 +2,267 @@
 Utility functions for JSON extraction code generation.
 """
 
+import gc
 import json
+import mmap
+import operator
 import os
+import re
 import requests
-from typing import Any, Dict, List, Union, Callable
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple, Union, Callable
 from urllib.parse import urlparse
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# From this many distinct keywords on, 'contains' scans with Hyperscan or Aho-Corasick
+CONTAINS_AUTOMATON_MIN_KEYWORDS = 5
+
+# JSON strings up to this length are memoized by parse_json_input (1MB)
+PARSE_CACHE_MAX_LENGTH = 1024 * 1024
+
+@lru_cache(maxsize=32)
 def get_matcher(mode: str) -> Callable[[str, str], bool]:
     """
     Get the appropriate matching function based on the mode.
+
+    Both arguments must already be lowercased, so the returned function is a
+    C-implemented str method rather than a lambda lowercasing on every call.
     
     Args:
         mode (str): One of 'match', 'contains', 'startswith', or 'endswith'
         
     Returns:
-        Callable[[str, str], bool]: A function that takes two strings and returns True if they match
+        Callable[[str, str], bool]: A function that takes a lowercased string and a lowercased keyword and returns True if they match
         
     Raises:
         ValueError: If mode is not one of the supported values
     """
     mode = mode.lower()
     if mode == 'match':
-        return lambda x, y: x.lower() == y.lower()
+        return operator.eq
     elif mode == 'contains':
-        return lambda x, y: y.lower() in x.lower()
+        return str.__contains__
     elif mode == 'startswith':
-        return lambda x, y: x.lower().startswith(y.lower())
+        return str.startswith
     elif mode == 'endswith':
-        return lambda x, y: x.lower().endswith(y.lower())
+        return str.endswith
     else:
         raise ValueError(f"Unsupported mode: {mode}. Must be one of: match, contains, startswith, endswith")
 
+@lru_cache(maxsize=128)
+def _compile_keyword_pattern(keywords_lower: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile lowercased keywords into one alternation.
+
+    Args:
+        keywords_lower (Tuple[str, ...]): Sorted, lowercased keywords
+
+    Returns:
+        re.Pattern[str]: Pattern that finds a lowercased string if it contains any keyword
+    """
+    return re.compile("|".join(map(re.escape, keywords_lower)))
+
+def _build_keyword_trie(by_lower: Dict[str, List[str]], reverse: bool) -> Dict[Any, Any]:
+    """
+    Build a character trie over lowercased keywords.
+
+    Each node maps a character to its child node; the None entry of a node holds
+    the original keywords ending there.
+
+    Args:
+        by_lower (Dict[str, List[str]]): Lowercased keywords mapped to their original spellings
+        reverse (bool): Insert the keywords reversed, for suffix matching
+
+    Returns:
+        Dict[Any, Any]: Root node of the trie
+    """
+    root: Dict[Any, Any] = {}
+    for keyword_lower, originals in by_lower.items():
+        node = root
+        for c in (reversed(keyword_lower) if reverse else keyword_lower):
+            node = node.setdefault(c, {})
+        node[None] = originals
+    return root
+
+@lru_cache(maxsize=128)
+def _compile_hyperscan_database(keywords_lower: Tuple[str, ...]) -> bytes:
+    """
+    Compile lowercased keywords into a serialized Hyperscan database of literal patterns.
+
+    Each keyword is written as escaped UTF-8 bytes, so the pattern ids are the
+    keywords' indexes and every keyword is reported at most once per scan.
+    Compiling takes far longer than a typical search, so the result is cached.
+    It is cached serialized because a database scans with its own scratch
+    space, which only serves one scan at a time: each matcher loads a copy.
+
+    Args:
+        keywords_lower (Tuple[str, ...]): Non-empty, lowercased keywords
+
+    Returns:
+        bytes: Database for block-mode scanning of UTF-8 encoded strings, for hyperscan.loadb
+    """
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[
+            "".join("\\x%02x" % b for b in keyword.encode('utf-8', 'surrogatepass')).encode()
+            for keyword in keywords_lower
+        ],
+        ids=list(range(len(keywords_lower))),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords_lower),
+    )
+    return hyperscan.dumpb(database)
+
+@lru_cache(maxsize=128)
+def _build_automaton(groups: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> "ahocorasick.Automaton":
+    """
+    Build an Aho-Corasick automaton over lowercased keywords.
+
+    Args:
+        groups (Tuple[Tuple[str, Tuple[str, ...]], ...]): Lowercased keywords paired
+            with their original spellings
+
+    Returns:
+        ahocorasick.Automaton: Automaton whose words map to the original spellings
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword_lower, originals in groups:
+        automaton.add_word(keyword_lower, originals)
+    automaton.make_automaton()
+    return automaton
+
+def build_matcher(keywords: List[str], mode: str) -> Callable[[str], List[str]]:
+    """
+    Build a function that finds all keywords matching a string in a single pass.
+
+    'match' is a dictionary lookup of the lowercased string. A single keyword is
+    tested with the matching str method. Otherwise 'startswith' and 'endswith'
+    walk a trie of the lowercased keywords (reversed for 'endswith') once per
+    string. For 'contains' with more than CONTAINS_AUTOMATON_MIN_KEYWORDS - 1
+    keywords, the keywords are compiled into one Hyperscan database if hyperscan
+    is installed, or else one Aho-Corasick automaton if pyahocorasick is
+    installed, so each string is scanned once no matter how many keywords there
+    are; both are cached across calls for the same keywords. Otherwise a
+    precompiled regex alternation rejects non-matching strings in one scan and
+    only strings that pass are tested against every lowercased keyword with
+    get_matcher.
+
+    Args:
+        keywords (List[str]): List of keywords to search for
+        mode (str): One of 'match', 'contains', 'startswith', or 'endswith'
+
+    Returns:
+        Callable[[str], List[str]]: A function that takes a lowercased string and
+            returns the keywords matching it
+
+    Raises:
+        ValueError: If mode is not one of the supported values
+    """
+    matcher = get_matcher(mode)
+    mode = mode.lower()
+    by_lower: Dict[str, List[str]] = {}
+    for keyword in keywords:
+        by_lower.setdefault(keyword.lower(), []).append(keyword)
+
+    if mode == 'match':
+        return lambda s: by_lower.get(s, [])
+
+    if len(by_lower) == 1:
+        # A single needle, lowercased once, is tested with the str method itself:
+        # cheaper than a trie walk or a regex scan followed by the same test
+        (keyword_lower, originals), = by_lower.items()
+        return lambda s: originals if matcher(s, keyword_lower) else []
+
+    # No keyword fits in a shorter string, which is common for values, so the
+    # functions below return before any scan for those
+    min_length = min(map(len, by_lower))
+
+    if mode in ('startswith', 'endswith'):
+        # Walk the string (backwards for 'endswith') down a keyword trie,
+        # collecting every keyword that ends on the way. This stops at the first
+        # character no keyword continues with, which beats an automaton scan.
+        reverse = mode == 'endswith'
+        trie = _build_keyword_trie(by_lower, reverse)
+
+        def find(s: str) -> List[str]:
+            if len(s) < min_length:
+                return []
+            node = trie
+            hits = list(node.get(None, ()))
+            for c in (reversed(s) if reverse else s):
+                node = node.get(c)
+                if node is None:
+                    break
+                hits.extend(node.get(None, ()))
+            return hits
+        return find
+
+    # Neither backend can hold an empty word, and for a few keywords the regex
+    # filter below rejects the typical non-matching string faster than a scan
+    use_automaton = len(by_lower) >= CONTAINS_AUTOMATON_MIN_KEYWORDS and '' not in by_lower
+
+    if use_automaton and HYPERSCAN_AVAILABLE:
+        groups = list(by_lower.values())
+        database = hyperscan.loadb(_compile_hyperscan_database(tuple(by_lower)), hyperscan.HS_MODE_BLOCK)
+        database.scratch = hyperscan.Scratch(database)
+        scan = database.scan
+
+        def find(s: str) -> List[str]:
+            if len(s) < min_length:
+                return []
+            hits: List[str] = []
+            scan(
+                s.encode('utf-8', 'surrogatepass'),
+                match_event_handler=lambda id, start, end, flags, context: hits.extend(groups[id]),
+            )
+            return hits
+        return find
+
+    if use_automaton and AHOCORASICK_AVAILABLE:
+        automaton = _build_automaton(tuple((k, tuple(v)) for k, v in by_lower.items()))
+
+        def find(s: str) -> List[str]:
+            if len(s) < min_length:
+                return []
+            # A keyword occurring several times in s is reported only once
+            hits = {}
+            for _, originals in automaton.iter(s):
+                hits[id(originals)] = originals
+            return [keyword for originals in hits.values() for keyword in originals]
+        return find
+
+    # A regex alternation reports a single keyword per scan, so it only
+    # serves as a filter before the exact per-keyword check
+    search = _compile_keyword_pattern(tuple(sorted(by_lower))).search
+
+    def find(s: str) -> List[str]:
+        if len(s) < min_length or search(s) is None:
+            return []
+        return [
+            keyword
+            for keyword_lower, originals in by_lower.items()
+            if matcher(s, keyword_lower)
+            for keyword in originals
+        ]
+    return find
+
 def is_valid_url(url: str) -> bool:
     """
     Check if a string is a valid URL.
@@ -49,9 +279,73 @@ def is_valid_url(url: str) -> bool:
     except:
         return False
 
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document with orjson if installed, otherwise with the json module.
+
+    Documents orjson rejects are parsed again with the json module, which accepts
+    NaN/Infinity and raises the usual json.JSONDecodeError for invalid input.
+
+    Args:
+        data (Union[str, bytes]): The JSON document
+
+    Returns:
+        Any: Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the input is invalid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def _load_json_file(file_path: str) -> Any:
+    """
+    Parse a JSON file, memory-mapping it for orjson instead of reading it into a bytes copy.
+
+    Args:
+        file_path (str): Path to the JSON file
+
+    Returns:
+        Any: Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the file is invalid JSON
+    """
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be mapped; the json module reports them as invalid
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    try:
+                        return orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        pass
+                return json.loads(mm[:])
+        return json.loads(f.read())
+
+@lru_cache(maxsize=32)
+def _parse_json_string(json_string: str) -> Union[Dict, List]:
+    """
+    Parse a JSON string, memoizing the result for repeated requests with the same document.
+
+    Args:
+        json_string (str): The JSON string to parse
+
+    Returns:
+        Union[Dict, List]: Parsed JSON object, shared between calls with the same string
+    """
+    return loads_json(json_string)
+
 def parse_json_input(json_input: Union[str, Dict, List]) -> Union[Dict, List]:
     """
     Parse JSON input from either a file path, URL, a JSON string, or return an already parsed JSON object.
+
+    JSON strings up to PARSE_CACHE_MAX_LENGTH characters are parsed once and the
+    same object is returned for repeated calls, so the result must be treated as read-only.
     
     Args:
         json_input (Union[str, Dict, List]): Either a path to a JSON file, a URL, a JSON string, or an already parsed JSON object
@@ -74,18 +368,20 @@ def parse_json_input(json_input: Union[str, Dict, List]) -> Union[Dict, List]:
         try:
             response = requests.get(json_input)
             response.raise_for_status()  # Raise an exception for bad status codes
-            return response.json()
-        except requests.RequestException as e:
+            # Parse the raw bytes, which orjson reads without decoding them to str first
+            return loads_json(response.content)
+        except (requests.RequestException, json.JSONDecodeError) as e:
             raise ValueError(f"Error fetching JSON from URL: {str(e)}")
     
     # Check if the input is a file path
     if os.path.isfile(json_input):
-        with open(json_input, 'r') as f:
-            return json.load(f)
+        return _load_json_file(json_input)
     
     # Try to parse as JSON string
     try:
-        return json.loads(json_input)
+        if len(json_input) <= PARSE_CACHE_MAX_LENGTH:
+            return _parse_json_string(json_input)
+        return loads_json(json_input)
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(
             f"Invalid JSON string: {str(e)}. If you meant to provide a file path or URL, make sure it exists and is accessible.",
@@ -110,6 +406,9 @@ def validate_extraction_params(keywords: List[str], mode: str, type: str) -> Non
     
     if not all(isinstance(k, str) for k in keywords):
         raise ValueError("all keywords must be strings")
+
+    if not all(k.strip() for k in keywords):
+        raise ValueError("keywords must not be empty or whitespace only")
     
     if mode not in ['match', 'contains', 'startswith', 'endswith']:
         raise ValueError(f"Invalid mode: {mode}. Must be one of: match, contains, startswith, endswith")
@@ -117,17 +416,43 @@ def validate_extraction_params(keywords: List[str], mode: str, type: str) -> Non
     if type not in ['all', 'key', 'value']:
         raise ValueError(f"Invalid type: {type}. Must be one of: all, key, value")
 
-def get_key_with_extension(keyword: str, keyword_counts: Dict[str, int]) -> str:
+@contextmanager
+def gc_paused() -> Iterator[None]:
     """
-    Get the keyword with appropriate extension based on occurrence count.
-    
+    Pause the cyclic garbage collector for the duration of the block.
+
+    Collecting and labeling matches allocates a list per path and nothing that
+    can form a cycle, but every allocation burst would still trigger
+    collections that rescan the whole parsed document.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+def label_matches(
+    found: Dict[str, List[List[Union[str, int]]]]
+) -> Dict[str, List[List[Union[str, int]]]]:
+    """
+    Label the paths found for each keyword and sort the result by label.
+
+    The first path of a keyword is labeled with the keyword itself and later
+    paths get a numeric suffix (name, name_1, name_2, ...).
+
     Args:
-        keyword (str): The keyword to process
-        keyword_counts (Dict[str, int]): Dictionary tracking keyword occurrences
-        
+        found (Dict[str, List[List[Union[str, int]]]]): Keywords mapped to their paths in document order
+
     Returns:
-        str: The keyword with appropriate extension
+        Dict[str, List[List[Union[str, int]]]]: Dictionary mapping labels to their paths
     """
-    count = keyword_counts[keyword]
-    keyword_counts[keyword] += 1
-    return f"{keyword}_{count}" if count > 0 else keyword 
\ No newline at end of file
+    matches: Dict[str, List[List[Union[str, int]]]] = {}
+    with gc_paused():
+        for keyword, paths in found.items():
+            for count, path in enumerate(paths):
+                key = f"{keyword}_{count}" if count > 0 else keyword
+                matches.setdefault(key, []).append(path)
+        # Sorting the labels alone avoids building a (label, paths) tuple per match
+        return {label: matches[label] for label in sorted(matches)}
\ No newline at end of file